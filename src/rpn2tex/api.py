@@ -0,0 +1,41 @@
+"""Convenience API for rpn2tex - cached source-to-AST parsing.
+
+This module wraps the Lexer → Parser pipeline in a single call and
+caches the result per source string, so code that parses the same
+expressions repeatedly (tests, batch jobs, interactive tools) lexes
+and parses each distinct source only once.
+
+Example:
+    >>> from rpn2tex.api import parse_source
+    >>> parse_source("5 3 +") is parse_source("5 3 +")
+    True
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from rpn2tex.ast_nodes import Expr
+from rpn2tex.lexer import Lexer
+from rpn2tex.parser import Parser
+
+
+@lru_cache(maxsize=256)
+def parse_source(source: str) -> Expr:
+    """Parse RPN source text into an AST, caching the result.
+
+    The same AST object is returned for every call with an equal source
+    string, so callers must treat it as read-only. Errors are not cached:
+    invalid input re-raises on every call.
+
+    Args:
+        source: The RPN expression to parse
+
+    Returns:
+        The root expression node of the AST.
+
+    Raises:
+        LexerError: If an invalid character is encountered.
+        ParserError: If the input is invalid RPN.
+    """
+    return Parser(Lexer(source).tokenize()).parse()
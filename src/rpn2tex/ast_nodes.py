@@ -4,9 +4,11 @@ This module defines the Abstract Syntax Tree (AST) nodes used to represent
 parsed RPN expressions. Compare with txt2tex/ast_nodes.py for the full
 implementation with many more node types.
 
-AST nodes are immutable dataclasses that represent the structure of
-mathematical expressions. Each node carries position information for
-error reporting.
+AST nodes are dataclasses that represent the structure of mathematical
+expressions. Each node carries position information for error reporting.
+Nodes are never modified after construction; they are slotted rather
+than frozen, because frozen dataclasses pay for a guarded __setattr__
+on every field in __init__ and the parser builds one node per token.
 
 Node Types:
     Number: Numeric literals (5, 3.14, -2)
@@ -20,10 +22,34 @@ Exercise nodes (not implemented):
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-
-
-@dataclass(frozen=True)
+from dataclasses import dataclass, field
+
+# Operator precedence (higher = binds tighter)
+# Addition/subtraction: level 1
+# Multiplication/division: level 2
+OPERATOR_PRECEDENCE: dict[str, int] = {
+    "+": 1,
+    "-": 1,
+    "*": 2,
+    "/": 2,
+}
+
+# Operator to LaTeX mapping
+OPERATOR_LATEX: dict[str, str] = {
+    "+": "+",
+    "-": "-",
+    "*": r"\times",
+    "/": r"\div",
+}
+
+# Operator LaTeX with its surrounding spaces, as emitted between operands.
+# Built once here instead of formatting a new string for every node.
+PADDED_OPERATOR_LATEX: dict[str, str] = {
+    operator: f" {latex} " for operator, latex in OPERATOR_LATEX.items()
+}
+
+
+@dataclass(slots=True)
 class ASTNode:
     """Base class for all AST nodes.
 
@@ -38,7 +64,7 @@ class ASTNode:
     column: int
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Number(ASTNode):
     """Numeric literal node.
 
@@ -55,7 +81,7 @@ class Number(ASTNode):
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class BinaryOp(ASTNode):
     """Binary operation node.
 
@@ -65,6 +91,16 @@ class BinaryOp(ASTNode):
         operator: The operator string ("+", "-", "*", "/")
         left: The left operand expression
         right: The right operand expression
+        precedence: Precedence level of operator (derived, not passed in)
+        latex_op: LaTeX rendering of operator with its surrounding
+            spaces, e.g. " \\times " (derived, not passed in)
+
+    The derived attributes are looked up once at construction so that
+    code generation reads them directly instead of hashing the operator
+    at every visit.
+
+    Raises:
+        ValueError: If operator is not a known binary operator
 
     Example:
         >>> # Represents "5 + 3"
@@ -79,6 +115,17 @@ class BinaryOp(ASTNode):
     operator: str
     left: Expr
     right: Expr
+    precedence: int = field(init=False, repr=False, compare=False)
+    latex_op: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive precedence and LaTeX operator from the operator string."""
+        try:
+            precedence = OPERATOR_PRECEDENCE[self.operator]
+        except KeyError:
+            raise ValueError(f"Unknown operator {self.operator!r}") from None
+        self.precedence = precedence
+        self.latex_op = PADDED_OPERATOR_LATEX[self.operator]
 
 
 # Exercise: Add Exponent, SquareRoot, and NthRoot node types here.
@@ -2,12 +2,15 @@
 
 This module provides the CLI entry point that orchestrates
 the pipeline: read → tokenize → parse → generate → write.
+Conversion uses the fused single-pass converter (rpn2tex.fast), which
+produces the same output and errors as running each stage in turn.
 Compare with txt2tex/cli.py for the full implementation.
 
 Usage:
     rpn2tex input.rpn              # Output to stdout
     rpn2tex input.rpn -o out.tex   # Output to file
     echo "5 3 +" | rpn2tex -       # Read from stdin
+    rpn2tex --batch exprs.rpn      # One expression per line
 
 Key concepts demonstrated:
     - argparse argument parsing
@@ -22,9 +25,39 @@ import sys
 from pathlib import Path
 
 from rpn2tex.errors import ErrorFormatter
-from rpn2tex.latex_gen import LaTeXGenerator
-from rpn2tex.lexer import Lexer, LexerError
-from rpn2tex.parser import Parser, ParserError
+from rpn2tex.fast import convert
+from rpn2tex.lexer import LexerError
+from rpn2tex.parser import ParserError
+
+# Buffer size for the output file: the whole result goes out in one write
+_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _convert_lines(text: str) -> str:
+    """Convert each non-blank line of text as a separate expression.
+
+    Args:
+        text: Input with one RPN expression per line
+
+    Returns:
+        The LaTeX for each expression, one per line
+
+    Raises:
+        LexerError: If an invalid character is encountered.
+        ParserError: If a line is invalid RPN.
+        Either error is positioned at its line within the whole text.
+    """
+    results: list[str] = []
+    for line_num, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            results.append(convert(line))
+        except LexerError as e:
+            raise LexerError(e.message, line_num, e.column) from None
+        except ParserError as e:
+            raise ParserError(e.message, e.token._replace(line=line_num)) from None
+    return "\n".join(results)
 
 
 def main() -> int:
@@ -49,6 +82,11 @@ def main() -> int:
         type=Path,
         help="Output LaTeX file (default: stdout)",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Treat each input line as a separate expression (blank lines skipped)",
+    )
 
     args = parser.parse_args()
 
@@ -69,20 +107,10 @@ def main() -> int:
         print(f"Error: Expected a file, got a directory: {args.input}", file=sys.stderr)
         return 1
 
-    # Process: tokenize → parse → generate
+    # Process: tokenize → parse → generate, fused into a single pass
     formatter = ErrorFormatter(text)
     try:
-        # Tokenize
-        lexer = Lexer(text)
-        tokens = lexer.tokenize()
-
-        # Parse
-        parser_obj = Parser(tokens)
-        ast = parser_obj.parse()
-
-        # Generate LaTeX
-        generator = LaTeXGenerator()
-        latex = generator.generate(ast)
+        latex = _convert_lines(text) if args.batch else convert(text)
 
     except LexerError as e:
         formatted = formatter.format_error(e.message, e.line, e.column)
@@ -96,7 +124,11 @@ def main() -> int:
     # Write output
     if args.output is not None:
         try:
-            args.output.write_text(latex + "\n")
+            with args.output.open("w", buffering=_WRITE_BUFFER_SIZE) as f:
+                # Blank-only --batch input yields no lines, as on stdout
+                if latex:
+                    f.write(latex)
+                    f.write("\n")
             print(f"Generated: {args.output}", file=sys.stderr)
         except PermissionError:
             print(f"Error: Permission denied writing: {args.output}", file=sys.stderr)
@@ -104,8 +136,9 @@ def main() -> int:
         except IsADirectoryError:
             print(f"Error: Cannot write to directory: {args.output}", file=sys.stderr)
             return 1
-    else:
-        print(latex)
+    elif latex:
+        sys.stdout.write(latex)
+        sys.stdout.write("\n")
 
     return 0
 
@@ -71,17 +71,9 @@ class ErrorFormatter:
             >>> "^" in err
             True
         """
-        parts: list[str] = []
-
-        # Error header
-        parts.append(f"Error: {message}")
-        parts.append("")
-
-        # Source context
+        # Error header, blank line, then the source context
         context = self._get_context(line, column, context_lines)
-        parts.append(context)
-
-        return "\n".join(parts)
+        return f"Error: {message}\n\n{context}"
 
     def _get_context(self, line: int, column: int, context_lines: int) -> str:
         """Extract source context around error position.
@@ -109,19 +101,14 @@ class ErrorFormatter:
 
         for idx in range(start_idx, end_idx):
             line_num = idx + 1  # Convert back to 1-based
-            line_content = self.lines[idx] if idx < len(self.lines) else ""
 
-            # Format line with number
-            prefix = f"{line_num:>{num_width}} | "
-            result_lines.append(f"{prefix}{line_content}")
+            # Format line with number (end_idx is clamped, so idx is valid)
+            result_lines.append(f"{str(line_num).rjust(num_width)} | {self.lines[idx]}")
 
             # Add caret on error line
             if idx == error_idx:
-                # Spaces for line number column, then position caret
-                caret_prefix = " " * num_width + " | "
-                # Position caret at column (1-based, so column-1 spaces)
+                # Blank line-number column, then column-1 spaces (1-based)
                 caret_pos = max(0, column - 1)
-                caret_line = caret_prefix + " " * caret_pos + "^"
-                result_lines.append(caret_line)
+                result_lines.append(f"{' ' * num_width} | {' ' * caret_pos}^")
 
         return "\n".join(result_lines)
@@ -0,0 +1,139 @@
+"""Fused single-pass converter for rpn2tex - converts text straight to LaTeX.
+
+This module produces the same output as the full pipeline
+(Lexer → Parser → LaTeXGenerator) in one pass over the input, without
+building Token objects, an AST, or walking a tree afterwards.
+
+The trick is that RPN needs no lookahead: the RPN stack can hold the
+LaTeX of each operand, together with the precedence and operator it was
+built with, which is all the parenthesization rules need to know about
+a child.
+
+Operands are kept as ropes rather than strings: a rope is either a
+LaTeX fragment or a tuple of ropes to emit in order. Combining two
+operands builds one small tuple instead of copying both strings, so
+deep input stays linear, and the finished rope is flattened and joined
+once at the end.
+
+Example:
+    Input: "5 3 + 2 *"
+    Stack evolution:
+        5       -> [("5", atom)]
+        3       -> [("5", atom), ("3", atom)]
+        +       -> [(("5", " + ", "3"), 1)]
+        2       -> [(("5", " + ", "3"), 1), ("2", atom)]
+        *       -> [(("( ", ("5", " + ", "3"), " )", " \\times ", "2"), 2)]
+    Result: "$( 5 + 3 ) \\times 2$"
+
+Errors are not diagnosed here. Invalid input falls back to the full
+pipeline, which raises the usual LexerError or ParserError with the
+exact position, so callers see identical behaviour either way.
+"""
+
+from __future__ import annotations
+
+from typing import TypeAlias
+
+from rpn2tex.ast_nodes import OPERATOR_PRECEDENCE, PADDED_OPERATOR_LATEX
+from rpn2tex.latex_gen import LaTeXGenerator
+from rpn2tex.lexer import NUMBER_GROUP, TOKEN_PATTERN, WS_GROUP, Lexer
+from rpn2tex.parser import Parser
+
+# LaTeX fragments to emit in order, nested without copying
+_Rope: TypeAlias = "str | tuple[_Rope, ...]"
+
+# Precedence of a bare number: binds tighter than any operator
+_ATOM_PRECEDENCE = max(OPERATOR_PRECEDENCE.values()) + 1
+
+# (operator, precedence, " latex ") for each operator group of the
+# lexer's pattern, keyed by match.lastindex
+_OPERATORS: dict[int | None, tuple[str, int, str]] = {
+    TOKEN_PATTERN.groupindex[name]: (
+        op,
+        OPERATOR_PRECEDENCE[op],
+        PADDED_OPERATOR_LATEX[op],
+    )
+    for name, op in (("PLUS", "+"), ("MINUS", "-"), ("MULT", "*"), ("DIV", "/"))
+}
+
+
+def convert(text: str) -> str:
+    """Convert an RPN expression to LaTeX in a single pass.
+
+    Equivalent to LaTeXGenerator().generate(Parser(Lexer(text).tokenize())
+    .parse()), but much cheaper because no tokens or AST nodes are built.
+
+    Args:
+        text: The RPN expression to convert
+
+    Returns:
+        LaTeX string wrapped in math delimiters ($...$)
+
+    Raises:
+        LexerError: If an invalid character is encountered.
+        ParserError: If the input is invalid RPN.
+
+    Example:
+        >>> convert("2 3 + 4 *")
+        '$( 2 + 3 ) \\\\times 4$'
+    """
+    operators = _OPERATORS
+    # (latex, precedence, operator) for each operand on the RPN stack
+    stack: list[tuple[_Rope, int, str]] = []
+
+    for match in TOKEN_PATTERN.finditer(text):
+        index = match.lastindex
+
+        if index == NUMBER_GROUP:
+            stack.append((match.group(NUMBER_GROUP), _ATOM_PRECEDENCE, ""))
+            continue
+
+        operator = operators.get(index)
+        if operator is not None and len(stack) >= 2:
+            op, precedence, latex_op = operator
+            right, right_precedence, right_op = stack.pop()
+            left, left_precedence, _ = stack.pop()
+
+            # Same rules as LaTeXGenerator: lower precedence always needs
+            # parens; equal precedence on the right needs them for - and /
+            if left_precedence < precedence:
+                left = ("( ", left, " )")
+            if right_precedence < precedence or (
+                right_precedence == precedence and right_op in ("-", "/")
+            ):
+                right = ("( ", right, " )")
+
+            stack.append(((left, latex_op, right), precedence, op))
+            continue
+
+        if index == WS_GROUP and len(stack) == 1:
+            # End of input with exactly one expression left
+            return f"${_flatten(stack[0][0])}$"
+
+        break
+
+    # Invalid input: let the full pipeline raise the positioned error
+    return LaTeXGenerator().generate(Parser(Lexer(text).tokenize()).parse())
+
+
+def _flatten(rope: _Rope) -> str:
+    """Join the fragments of a rope in order, without recursion.
+
+    Args:
+        rope: A LaTeX fragment or nested tuple of fragments
+
+    Returns:
+        The concatenated LaTeX string
+    """
+    parts: list[str] = []
+    # Ropes still to emit; the top is emitted next
+    work: list[_Rope] = [rope]
+
+    while work:
+        item = work.pop()
+        if isinstance(item, str):
+            parts.append(item)
+        else:
+            work.extend(reversed(item))
+
+    return "".join(parts)
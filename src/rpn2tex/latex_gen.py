@@ -4,7 +4,7 @@ This module converts the AST into LaTeX math mode output.
 Compare with txt2tex/latex_gen.py for the full implementation.
 
 Key concepts demonstrated:
-    - Visitor pattern using @singledispatchmethod
+    - Iterative post-order tree walk with an explicit stack
     - Operator precedence for parenthesization
     - LaTeX math mode output
 
@@ -16,18 +16,34 @@ The generator produces infix notation from the parsed RPN tree:
 
 from __future__ import annotations
 
-from functools import singledispatchmethod
+from collections.abc import Callable
 from typing import ClassVar
 
-from rpn2tex.ast_nodes import BinaryOp, Expr, Number
+from rpn2tex.ast_nodes import (
+    OPERATOR_LATEX,
+    OPERATOR_PRECEDENCE,
+    BinaryOp,
+    Expr,
+    Number,
+)
+
+# Stand-in for operand values when compiling a template; never occurs in
+# the literal fragments the generator emits
+_OPERAND_SLOT = "\x00"
 
 
 class LaTeXGenerator:
     """Converts rpn2tex AST to LaTeX source code.
 
-    Uses the visitor pattern via @singledispatchmethod to handle
-    different node types. Manages operator precedence to insert
-    parentheses only where needed.
+    Walks the AST iteratively (post-order, explicit stack) so that
+    expression depth is not limited by Python's recursion limit.
+    Manages operator precedence to insert parentheses only where needed.
+
+    With memo_size set, the most recently generated trees are memoized
+    by node identity, so generating one again (or a tree built on top of
+    one) reuses its LaTeX instead of walking it. The memo cannot see
+    mutation: only enable it for trees that are not changed after they
+    have been rendered.
 
     Class Attributes:
         BINARY_OPS: Mapping from operator strings to LaTeX commands
@@ -43,23 +59,30 @@ class LaTeXGenerator:
         $5 + 3$
     """
 
-    # Operator to LaTeX mapping
-    BINARY_OPS: ClassVar[dict[str, str]] = {
-        "+": "+",
-        "-": "-",
-        "*": r"\times",
-        "/": r"\div",
-    }
+    # Operator to LaTeX mapping (aliases of the ast_nodes module tables,
+    # kept for API compatibility; the walk itself does not consult them)
+    BINARY_OPS: ClassVar[dict[str, str]] = OPERATOR_LATEX
 
     # Operator precedence (higher = binds tighter)
     # Addition/subtraction: level 1
     # Multiplication/division: level 2
-    PRECEDENCE: ClassVar[dict[str, int]] = {
-        "+": 1,
-        "-": 1,
-        "*": 2,
-        "/": 2,
-    }
+    PRECEDENCE: ClassVar[dict[str, int]] = OPERATOR_PRECEDENCE
+
+    # id(node) -> (node, LaTeX), oldest first. Holding the node keeps it
+    # alive, so its id cannot be reused by another object while the entry
+    # exists.
+    _memo: dict[int, tuple[Expr, str]]
+    _memo_size: int
+
+    def __init__(self, *, memo_size: int = 0) -> None:
+        """Initialize generator with an empty render cache.
+
+        Args:
+            memo_size: Number of generated trees to memoize; 0 disables
+                the memo
+        """
+        self._memo = {}
+        self._memo_size = memo_size
 
     def generate(self, ast: Expr) -> str:
         """Generate LaTeX from AST.
@@ -78,107 +101,161 @@ class LaTeXGenerator:
         content = self._visit(ast)
         return f"${content}$"
 
-    @singledispatchmethod
-    def _visit(self, node: Expr) -> str:
-        """Visit an AST node and generate LaTeX.
+    def compile(self, ast: Expr) -> Callable[..., str]:
+        """Compile the shape of an AST into a reusable LaTeX template.
+
+        The tree's structure (operators and parentheses) is rendered once
+        into a str.format template with a slot for each operand. Calling
+        the result with new operand values renders a tree of the same
+        shape without walking it, which pays off when many expressions
+        share one shape (e.g. one formula applied to different inputs).
 
-        This is the dispatcher for the visitor pattern.
-        Specific node types are handled by registered implementations.
+        Compiling walks the whole tree, so keep the returned function
+        rather than compiling again. There is no cache keyed by shape:
+        working out a tree's shape costs the same walk as compiling it.
 
         Args:
-            node: The AST node to visit
+            ast: The root expression node whose shape is compiled
 
         Returns:
-            LaTeX string for the node
+            A function taking one value per operand, in RPN (left to right)
+            order, and returning LaTeX wrapped in math delimiters ($...$).
+            It raises TypeError when given the wrong number of values.
 
-        Raises:
-            NotImplementedError: For unhandled node types
+        Example:
+            >>> ast = Parser(Lexer("5 3 + 2 *").tokenize()).parse()
+            >>> render = LaTeXGenerator().compile(ast)
+            >>> render("1", "2", "3")
+            '$( 1 + 2 ) \\\\times 3$'
         """
-        raise NotImplementedError(f"No visitor for {type(node).__name__}")
+        # Render with a placeholder for every operand, escape the literal
+        # text for str.format, then turn the placeholders into slots
+        content = self._render(ast, _OPERAND_SLOT)
+        operand_count = content.count(_OPERAND_SLOT)
+        template = content.replace("{", "{{").replace("}", "}}")
+        fill = f"${template.replace(_OPERAND_SLOT, '{}')}$".format
 
-    @_visit.register
-    def _visit_number(self, node: Number) -> str:
-        """Generate LaTeX for a number literal.
+        def render(*values: str) -> str:
+            # str.format ignores extra arguments, so check the count here
+            if len(values) != operand_count:
+                raise TypeError(
+                    f"Template takes {operand_count} operands, got {len(values)}"
+                )
+            return fill(*values)
 
-        Args:
-            node: The Number node
-
-        Returns:
-            The number value as a string
-        """
-        return node.value
+        return render
 
-    @_visit.register
-    def _visit_binary_op(self, node: BinaryOp) -> str:
-        """Generate LaTeX for a binary operation.
+    def _visit(self, root: Expr) -> str:
+        """Generate LaTeX for an expression tree, memoized by identity.
 
-        Handles operator precedence by adding parentheses around
-        lower-precedence sub-expressions.
+        When the memo is full, the least recently generated tree is
+        evicted.
 
         Args:
-            node: The BinaryOp node
+            root: The root expression node
 
         Returns:
-            LaTeX string with appropriate parentheses
-
-        Example:
-            >>> # For "5 3 + 2 *" -> (5 + 3) * 2
-            >>> # The addition needs parens because * has higher precedence
+            LaTeX string for the expression (without math delimiters)
         """
-        op_latex = self.BINARY_OPS[node.operator]
-        my_precedence = self.PRECEDENCE[node.operator]
+        memo = self._memo
+        # Drop the entry first so storing it again marks it most recent
+        cached = memo.pop(id(root), None)
+        result = self._render(root) if cached is None else cached[1]
 
-        # Generate left operand, adding parens if needed
-        left = self._visit(node.left)
-        if self._needs_parens(node.left, my_precedence, is_right=False):
-            left = f"( {left} )"
+        if self._memo_size:
+            memo[id(root)] = (root, result)
+            if len(memo) > self._memo_size:
+                del memo[next(iter(memo))]
 
-        # Generate right operand, adding parens if needed
-        right = self._visit(node.right)
-        if self._needs_parens(node.right, my_precedence, is_right=True):
-            right = f"( {right} )"
+        return result
 
-        return f"{left} {op_latex} {right}"
+    def _render(self, root: Expr, operand_slot: str | None = None) -> str:
+        """Generate LaTeX for an expression tree without recursion.
 
-    def _needs_parens(
-        self, child: Expr, parent_precedence: int, *, is_right: bool
-    ) -> bool:
-        """Determine if a child expression needs parentheses.
+        Walks the tree using an explicit work stack, so deeply nested
+        input cannot exhaust the Python call stack. The stack holds both
+        nodes still to expand and literal fragments ("( ", " )", the
+        operator) scheduled between them. Popping in order writes the
+        output left to right into a single list, which is joined once at
+        the end, so no per-subtree strings are built.
 
-        Parentheses are needed when:
+        Operations still in the memo are emitted as their cached LaTeX
+        instead of being walked again, so a tree that reuses earlier trees
+        as operands costs only its new nodes.
+
+        Parentheses are added around a child operation when:
         1. Child has lower precedence than parent
         2. Child has equal precedence and is on the right side
            (for left-associative operators like -)
 
         Args:
-            child: The child expression
-            parent_precedence: Precedence of the parent operator
-            is_right: True if child is the right operand
+            root: The root expression node
+            operand_slot: If given, emitted in place of every number's value
 
         Returns:
-            True if parentheses are needed
+            LaTeX string for the expression (without math delimiters)
+
+        Raises:
+            NotImplementedError: For unhandled node types
 
         Example:
+            >>> # For "5 3 + 2 *" -> (5 + 3) * 2
+            >>> # The addition needs parens because * has higher precedence
             >>> # 5 - (3 - 2) needs parens on right
             >>> # (5 - 3) - 2 doesn't need parens (left-associative)
         """
-        if not isinstance(child, BinaryOp):
-            return False
-
-        child_precedence = self.PRECEDENCE[child.operator]
-
-        # Lower precedence always needs parens
-        if child_precedence < parent_precedence:
-            return True
-
-        # Equal precedence on right side needs parens for non-commutative operators
-        # (handles left-associativity of - and /)
-        return (
-            child_precedence == parent_precedence
-            and is_right
-            and child.operator in ("-", "/")
-        )
-
-
-# Exercise: Add visitors for Exponent, SquareRoot, and NthRoot here.
+        # Nodes to expand and fragments to emit; the top is emitted next
+        work: list[Expr | str] = [root]
+        parts: list[str] = []
+        # Cached renders carry real operand values, so templates skip them
+        memo = self._memo if operand_slot is None else {}
+
+        while work:
+            item = work.pop()
+
+            if isinstance(item, str):
+                parts.append(item)
+
+            elif isinstance(item, Number):
+                parts.append(item.value if operand_slot is None else operand_slot)
+
+            elif memo and (cached := memo.get(id(item))) is not None:
+                parts.append(cached[1])
+
+            # Always true for the type checker (Expr is Number | BinaryOp),
+            # but other node classes must reach the error below at runtime
+            elif isinstance(item, BinaryOp):  # pyright: ignore[reportUnnecessaryIsInstance]
+                my_precedence = item.precedence
+                left = item.left
+                right = item.right
+
+                # Push in reverse: right side first so the left is popped first.
+                # Equal precedence on right side needs parens for
+                # non-commutative operators (left-associativity of - and /)
+                if isinstance(right, BinaryOp) and (
+                    right.precedence < my_precedence
+                    or (
+                        right.precedence == my_precedence
+                        and right.operator in ("-", "/")
+                    )
+                ):
+                    work.extend((" )", right, "( "))
+                else:
+                    work.append(right)
+
+                work.append(item.latex_op)
+
+                # Lower precedence always needs parens
+                if isinstance(left, BinaryOp) and left.precedence < my_precedence:
+                    work.extend((" )", left, "( "))
+                else:
+                    work.append(left)
+
+            else:
+                raise NotImplementedError(f"No visitor for {type(item).__name__}")
+
+        return "".join(parts)
+
+
+# Exercise: Handle Exponent, SquareRoot, and NthRoot in _render above.
 # See README.md for implementation hints.
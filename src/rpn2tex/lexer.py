@@ -7,7 +7,7 @@ The lexer converts input text like "5 3 +" into a stream of tokens:
     [Token(NUMBER, "5"), Token(NUMBER, "3"), Token(PLUS, "+"), Token(EOF, "")]
 
 Key concepts demonstrated:
-    - Character-by-character scanning
+    - Scanning with a single "master" regular expression
     - Position tracking (line, column)
     - Token generation
     - Error handling with position information
@@ -15,8 +15,60 @@ Key concepts demonstrated:
 
 from __future__ import annotations
 
+import re
+from collections.abc import Sequence
+from typing import Final
+
 from rpn2tex.tokens import Token, TokenType
 
+# The whole scanner. Each match is optional leading whitespace (WS)
+# followed by exactly one lexeme, so there is one match per token; the
+# last match is the trailing whitespace before end of input.
+# Alternatives are tried in order, and the group that matched
+# (match.lastindex) identifies the token type.
+TOKEN_PATTERN: Final = re.compile(
+    r"""
+    (?P<WS>[ \t\n\r]*)            # skipped; may contain newlines
+    (?:
+        # Before MINUS, so "-" directly followed by a digit is a negative
+        # number (in RPN, a standalone "-" is always subtraction). ASCII
+        # digits only: \d would also accept e.g. "\u0663"
+        (?P<NUMBER>-?[0-9]+(?:\.[0-9]*)?)
+      | (?P<PLUS>\+)
+      | (?P<MINUS>-)
+      | (?P<MULT>\*)
+      | (?P<DIV>/)
+      | (?P<BAD>[^ \t\n\r])       # any other character: LexerError
+      | \Z                        # only whitespace left
+    )
+    """,
+    re.VERBOSE,
+)
+
+# Token type for each lexeme group, keyed by match.lastindex. BAD
+# produces no token, and the WS group is last only at end of input.
+_GROUP_TYPES: dict[int | None, TokenType] = {
+    index: TokenType[name]
+    for name, index in TOKEN_PATTERN.groupindex.items()
+    if name in TokenType.__members__
+}
+
+# Indices of the WS and NUMBER groups, shared with rpn2tex.fast
+WS_GROUP: Final = TOKEN_PATTERN.groupindex["WS"]
+NUMBER_GROUP: Final = TOKEN_PATTERN.groupindex["NUMBER"]
+
+# Single-character lexemes, for the space-separated fast path
+_OPERATOR_TYPES: dict[str, TokenType] = {
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.MULT,
+    "/": TokenType.DIV,
+}
+
+# Separates sources joined by Lexer.tokenize_many. Not valid in any
+# source, so the scanner reports it through the BAD group.
+_SOURCE_SEPARATOR: Final = "\x00"
+
 
 class LexerError(Exception):
     """Raised when lexer encounters invalid input.
@@ -46,7 +98,8 @@ class LexerError(Exception):
 class Lexer:
     """Tokenizes RPN input text.
 
-    The lexer scans input character by character, producing tokens for:
+    The lexer scans input with a single compiled regular expression,
+    producing tokens for:
         - Numbers (integers and decimals)
         - Operators (+, -, *, /)
         - EOF marker
@@ -95,106 +148,165 @@ class Lexer:
             >>> Lexer("2 3 + 4 *").tokenize()
             [Token(NUMBER, '2', 1:1), Token(NUMBER, '3', 1:3), ...]
         """
-        tokens: list[Token] = []
-
-        while not self._at_end():
-            self._skip_whitespace()
-            if self._at_end():
-                break
-            tokens.append(self._scan_token())
+        if self.pos == 0:
+            spaced = self._tokenize_spaced()
+            if spaced is not None:
+                return spaced
 
-        # Add EOF token
-        tokens.append(Token(TokenType.EOF, "", self.line, self.column))
-        return tokens
+        return self._scan()[0]
 
-    def _at_end(self) -> bool:
-        """Check if we've reached the end of input."""
-        return self.pos >= len(self.text)
-
-    def _peek(self) -> str:
-        """Look at current character without consuming it."""
-        if self._at_end():
-            return ""
-        return self.text[self.pos]
-
-    def _advance(self) -> str:
-        """Consume and return the current character."""
-        char = self.text[self.pos]
-        self.pos += 1
-        if char == "\n":
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-        return char
+    def _scan(self, separator: str | None = None) -> list[list[Token]]:
+        """Tokenize from the current position to the end with the scanner.
 
-    def _skip_whitespace(self) -> None:
-        """Skip over whitespace characters."""
-        while not self._at_end() and self._peek() in " \t\n\r":
-            self._advance()
+        All scanning happens inside the regex engine; the loop runs once
+        per token, not once per character.
 
-    def _scan_token(self) -> Token:
-        """Scan and return the next token.
+        Args:
+            separator: Character that ends one source and starts the next,
+                with positions restarting at line 1, column 1. If None the
+                text is a single source and the character is invalid.
 
         Returns:
-            The next token from the input.
+            One token list per source, each ending with an EOF token.
 
         Raises:
             LexerError: If an invalid character is encountered.
         """
-        start_line = self.line
-        start_column = self.column
-        char = self._peek()
-
-        # Single-character operators
-        if char == "+":
-            self._advance()
-            return Token(TokenType.PLUS, "+", start_line, start_column)
-        if char == "-":
-            # Could be negative number or subtraction operator
-            # In RPN, standalone "-" is always subtraction
-            # Negative numbers are written as "0 5 -" or handled specially
-            self._advance()
-            # Check if this is a negative number (digit follows immediately)
-            if not self._at_end() and self._peek().isdigit():
-                # It's a negative number
-                return self._scan_number("-", start_line, start_column)
-            return Token(TokenType.MINUS, "-", start_line, start_column)
-        if char == "*":
-            self._advance()
-            return Token(TokenType.MULT, "*", start_line, start_column)
-        if char == "/":
-            self._advance()
-            return Token(TokenType.DIV, "/", start_line, start_column)
-
-        # Numbers
-        if char.isdigit():
-            return self._scan_number("", start_line, start_column)
-
-        # Unknown character
-        raise LexerError(f"Unexpected character '{char}'", start_line, start_column)
-
-    def _scan_number(self, prefix: str, start_line: int, start_column: int) -> Token:
-        """Scan a numeric literal.
+        text = self.text
+        length = len(text)
+        line = self.line
+        line_start = self.pos - self.column + 1  # offset where line begins
+        # Offset of the next newline; find()'s -1 (none left) maps to length
+        next_newline = text.find("\n", self.pos) % (length + 1)
+        group_types = _GROUP_TYPES
+        results: list[list[Token]] = []
+        tokens: list[Token] = []
 
-        Args:
-            prefix: Any prefix already consumed (e.g., "-" for negatives)
-            start_line: Line where number started
-            start_column: Column where number started
+        for match in TOKEN_PATTERN.finditer(text, self.pos):
+            start = match.end(WS_GROUP)
+
+            # Newlines only occur in whitespace; catch up if we crossed any
+            if start > next_newline:
+                line += text.count("\n", line_start, start)
+                line_start = text.rfind("\n", 0, start) + 1
+                next_newline = text.find("\n", start) % (length + 1)
+
+            token_type = group_types.get(match.lastindex)
+            if token_type is None:
+                if match.lastindex == WS_GROUP:
+                    break  # only whitespace left: end of input
+                column = start - line_start + 1
+                if text[start] != separator:
+                    self.pos, self.line, self.column = start, line, column
+                    raise LexerError(
+                        f"Unexpected character '{text[start]}'", line, column
+                    )
+                # End of one source: close it and restart positions
+                tokens.append(Token(TokenType.EOF, "", line, column))
+                results.append(tokens)
+                tokens = []
+                line = 1
+                line_start = start + 1
+                continue
+
+            tokens.append(
+                Token(
+                    token_type, text[start : match.end()], line, start - line_start + 1
+                )
+            )
+
+        self.pos, self.line, self.column = length, line, length - line_start + 1
+
+        # Add EOF token
+        tokens.append(Token(TokenType.EOF, "", self.line, self.column))
+        results.append(tokens)
+        return results
+
+    def _tokenize_spaced(self) -> list[Token] | None:
+        """Tokenize single-line, space-separated input without the scanner.
+
+        Typical input is lexemes separated by plain spaces on one line.
+        str.split(" ") finds those lexemes in a single C call, and each
+        is classified by a dict lookup (operators) or a fullmatch of the
+        scanner's pattern (numbers), which beats running the scanner.
 
         Returns:
-            A NUMBER token.
+            The tokens the scanner would produce (position state updated
+            the same way), or None if the input needs the scanner: other
+            whitespace, adjacent lexemes, or an invalid character.
         """
-        value = prefix
+        text = self.text
+        if "\n" in text or "\t" in text or "\r" in text:
+            return None
+
+        operator_types = _OPERATOR_TYPES
+        fullmatch = TOKEN_PATTERN.fullmatch
+        line = self.line
+        column = self.column
+        tokens: list[Token] = []
+
+        for lexeme in text.split(" "):
+            if lexeme:
+                token_type = operator_types.get(lexeme)
+                if token_type is None:
+                    # No other whitespace, so the WS group matched nothing
+                    match = fullmatch(lexeme)
+                    if match is None or match.lastindex != NUMBER_GROUP:
+                        return None
+                    token_type = TokenType.NUMBER
+                tokens.append(Token(token_type, lexeme, line, column))
+                column += len(lexeme)
+            column += 1  # the separating space (one too many after the last)
+
+        self.pos, self.column = len(text), column - 1
+        tokens.append(Token(TokenType.EOF, "", line, self.column))
+        return tokens
+
+    @classmethod
+    def tokenize_many(cls, sources: Sequence[str]) -> list[list[Token]]:
+        """Tokenize several independent sources in a single scan.
+
+        Sources that fit the str.split fast path are tokenized with it.
+        The rest are joined with a separator and scanned with one regex
+        sweep, which saves the per-call setup of scanning each source
+        separately. Each result is exactly what Lexer(source).tokenize()
+        returns, positions included.
+
+        Args:
+            sources: The RPN expressions to tokenize
+
+        Returns:
+            One token list (ending with EOF) per source, in order.
 
-        # Integer part
-        while not self._at_end() and self._peek().isdigit():
-            value += self._advance()
+        Raises:
+            LexerError: For the first source containing an invalid
+                character, positioned within that source.
 
-        # Decimal part (optional)
-        if not self._at_end() and self._peek() == ".":
-            value += self._advance()  # consume '.'
-            while not self._at_end() and self._peek().isdigit():
-                value += self._advance()
+        Example:
+            >>> [len(t) for t in Lexer.tokenize_many(["5 3 +", "42"])]
+            [4, 2]
+        """
+        # Typical sources take the split fast path; the rest share one
+        # scan over their joined text
+        spaced: list[list[Token] | None] = []
+        for source in sources:
+            lexer = cls(source)
+            spaced.append(lexer._tokenize_spaced())
+        pending = [
+            source
+            for source, tokens in zip(sources, spaced, strict=True)
+            if tokens is None
+        ]
+
+        if not pending:
+            scanned: list[list[Token]] = []
+        elif any(_SOURCE_SEPARATOR in source for source in pending):
+            # A source contains the separator itself; it is invalid input,
+            # so tokenize one at a time to report it at the right place
+            scanned = [cls(source).tokenize() for source in pending]
+        else:
+            lexer = cls(_SOURCE_SEPARATOR.join(pending))
+            scanned = lexer._scan(_SOURCE_SEPARATOR)
 
-        return Token(TokenType.NUMBER, value, start_line, start_column)
+        remaining = iter(scanned)
+        return [next(remaining) if tokens is None else tokens for tokens in spaced]
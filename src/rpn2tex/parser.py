@@ -27,8 +27,28 @@ Key concepts demonstrated:
 
 from __future__ import annotations
 
+from itertools import islice
+from typing import cast
+
 from rpn2tex.ast_nodes import BinaryOp, Expr, Number
-from rpn2tex.tokens import Token, TokenType
+from rpn2tex.tokens import (
+    DIV,
+    EOF,
+    MINUS,
+    MULT,
+    NUMBER,
+    OPERATOR_MASK,
+    PLUS,
+    Token,
+)
+
+# Map operator token type to operator string
+_OP_MAP: dict[int, str] = {
+    PLUS: "+",
+    MINUS: "-",
+    MULT: "*",
+    DIV: "/",
+}
 
 
 class ParserError(Exception):
@@ -99,85 +119,66 @@ class Parser:
             >>> ast = Parser(tokens).parse()
             >>> # Result: (2 + 3) * 4
         """
-        stack: list[Expr] = []
-
-        while not self._at_end():
-            token: Token = self._current()
-
-            if token.type == TokenType.NUMBER:
+        tokens = self.tokens
+
+        # Pre-sized operand stack with an explicit stack pointer: depth
+        # never exceeds the token count, so the list is never resized.
+        # Slots at or above sp are never read, so the None fill is
+        # invisible to the rest of the method.
+        stack = cast("list[Expr]", [None] * len(tokens))
+        sp = 0
+
+        # A plain loop over the token list, with self.pos written back
+        # only where parsing stops, instead of _current/_at_end/_advance
+        # method calls for every token
+        for pos, token in enumerate(islice(tokens, self.pos, None), self.pos):
+            token_type = token.type
+
+            if token_type == NUMBER:
                 # Push number onto stack
-                num_node = Number(
+                stack[sp] = Number(
                     line=token.line, column=token.column, value=token.value
                 )
-                stack.append(num_node)
-                self._advance()
-
-            elif token.type in (
-                TokenType.PLUS,
-                TokenType.MINUS,
-                TokenType.MULT,
-                TokenType.DIV,
-            ):
+                sp += 1
+
+            elif token_type & OPERATOR_MASK:
                 # Pop two operands and create binary operation
-                if len(stack) < 2:
+                if sp < 2:
+                    self.pos = pos
                     raise ParserError(
                         f"Operator '{token.value}' requires two operands", token
                     )
 
-                right = stack.pop()
-                left = stack.pop()
+                # The result replaces the left operand in place
+                sp -= 1
+                operator = _OP_MAP[token_type]
 
-                # Map token type to operator string
-                op_map = {
-                    TokenType.PLUS: "+",
-                    TokenType.MINUS: "-",
-                    TokenType.MULT: "*",
-                    TokenType.DIV: "/",
-                }
-                operator = op_map[token.type]
-
-                op_node = BinaryOp(
+                stack[sp - 1] = BinaryOp(
                     line=token.line,
                     column=token.column,
                     operator=operator,
-                    left=left,
-                    right=right,
+                    left=stack[sp - 1],
+                    right=stack[sp],
                 )
-                stack.append(op_node)
-                self._advance()
 
-            elif token.type == TokenType.EOF:
+            elif token_type == EOF:
+                self.pos = pos
                 break
 
             else:
+                self.pos = pos
                 raise ParserError(f"Unexpected token '{token.value}'", token)
 
         # Validate final state
-        if len(stack) == 0:
+        if sp == 0:
             eof_token = self.tokens[-1]
             raise ParserError("Empty expression", eof_token)
 
-        if len(stack) > 1:
+        if sp > 1:
             # Find the first unconsumed operand for error location
             raise ParserError(
-                f"Invalid RPN: {len(stack)} values remain on stack "
-                "(missing operators?)",
+                f"Invalid RPN: {sp} values remain on stack (missing operators?)",
                 self.tokens[-1],
             )
 
         return stack[0]
-
-    def _current(self) -> Token:
-        """Get the current token."""
-        return self.tokens[self.pos]
-
-    def _at_end(self) -> bool:
-        """Check if we've reached EOF."""
-        return self.tokens[self.pos].type == TokenType.EOF
-
-    def _advance(self) -> Token:
-        """Consume and return current token, advance to next."""
-        token = self.tokens[self.pos]
-        if not self._at_end():
-            self.pos += 1
-        return token
@@ -19,36 +19,57 @@ Exercise tokens (not implemented):
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum
+from typing import Final, NamedTuple
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
     """Token types for rpn2tex lexer.
 
     Each token type represents a distinct lexical element in RPN expressions.
+
+    Values are distinct bits so a whole class of token types can be
+    tested with one mask (see OPERATOR_MASK) instead of a tuple
+    membership check.
     """
 
     # Literals
-    NUMBER = auto()  # Numeric values: 5, 3.14, -2
+    NUMBER = 1  # Numeric values: 5, 3.14, -2
 
     # Operators
-    PLUS = auto()  # + (addition)
-    MINUS = auto()  # - (subtraction)
-    MULT = auto()  # * (multiplication)
-    DIV = auto()  # / (division)
+    PLUS = 2  # + (addition)
+    MINUS = 4  # - (subtraction)
+    MULT = 8  # * (multiplication)
+    DIV = 16  # / (division)
 
     # Exercise: Add CARET, SQRT, ROOT token types here
+    # (using the next free bits: 64, 128, ...)
     # See README.md for implementation hints
 
     # Special
-    EOF = auto()  # End of input
+    EOF = 32  # End of input
+
+
+# Plain-int aliases of the token types for hot loops. Reading a member
+# off the enum class costs several times more than reading a module
+# global, and TokenType members compare equal to these ints.
+NUMBER: Final = int(TokenType.NUMBER)
+PLUS: Final = int(TokenType.PLUS)
+MINUS: Final = int(TokenType.MINUS)
+MULT: Final = int(TokenType.MULT)
+DIV: Final = int(TokenType.DIV)
+EOF: Final = int(TokenType.EOF)
 
+# Set for every binary operator token type: `token.type & OPERATOR_MASK`
+OPERATOR_MASK: Final = PLUS | MINUS | MULT | DIV
 
-@dataclass(frozen=True)
-class Token:
+
+class Token(NamedTuple):
     """A lexical token with type, value, and position.
 
+    Tokens are created once per lexeme, so they are NamedTuples: cheap
+    to build, immutable, and without a per-instance __dict__.
+
     Attributes:
         type: The token type (from TokenType enum)
         value: The string value of the token
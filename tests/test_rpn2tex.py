@@ -1,3 +1,4 @@
+# pyright: reportPrivateUsage=false
 """Tests for rpn2tex - demonstrates usage of each module.
 
 These tests serve as both validation and documentation of the rpn2tex API.
@@ -6,15 +7,26 @@ Run with: hatch run test
 Compare with txt2tex/tests/ for comprehensive test patterns.
 """
 
+from pathlib import Path
+from typing import cast
+
 import pytest
 
-from rpn2tex.ast_nodes import BinaryOp, Number
+from rpn2tex import ast_nodes
+from rpn2tex.api import parse_source
+from rpn2tex.ast_nodes import ASTNode, BinaryOp, Expr, Number
+from rpn2tex.cli import main
 from rpn2tex.errors import ErrorFormatter
+from rpn2tex.fast import convert
 from rpn2tex.latex_gen import LaTeXGenerator
 from rpn2tex.lexer import Lexer, LexerError
 from rpn2tex.parser import Parser, ParserError
 from rpn2tex.tokens import TokenType
 
+# True when running against the opt-in mypyc build (chunk0-19), whose
+# compiled classes type-check their fields at construction
+AST_NODES_COMPILED = Path(ast_nodes.__file__ or "").suffix != ".py"
+
 
 class TestLexer:
     """Test the lexer module."""
@@ -45,16 +57,19 @@ class TestLexer:
         assert tokens[0].type == TokenType.NUMBER
         assert tokens[0].value == "-3.14"
 
-    def test_operators(self) -> None:
-        """Lexer tokenizes all operators."""
-        tokens = Lexer("+ - * /").tokenize()
-        types = [t.type for t in tokens[:-1]]  # Exclude EOF
-        assert types == [
-            TokenType.PLUS,
-            TokenType.MINUS,
-            TokenType.MULT,
-            TokenType.DIV,
-        ]
+    @pytest.mark.parametrize(
+        ("op_char", "op_type"),
+        [
+            ("+", TokenType.PLUS),
+            ("-", TokenType.MINUS),
+            ("*", TokenType.MULT),
+            ("/", TokenType.DIV),
+        ],
+    )
+    def test_operators(self, op_char: str, op_type: TokenType) -> None:
+        """Lexer tokenizes each operator."""
+        tokens = Lexer(op_char).tokenize()
+        assert [t.type for t in tokens] == [op_type, TokenType.EOF]
 
     def test_simple_expression(self) -> None:
         """Lexer tokenizes '5 3 +' correctly."""
@@ -85,6 +100,38 @@ class TestLexer:
             Lexer("5 @").tokenize()
         assert "Unexpected character '@'" in str(exc_info.value)
 
+    def test_spaced_and_scanned_agree(self) -> None:
+        """Space-separated input lexes the same as input needing the scanner."""
+        spaced = Lexer("5  -3 +").tokenize()
+        scanned = Lexer("5\t -3\t+").tokenize()
+        assert [(t.type, t.value, t.column) for t in spaced] == [
+            (t.type, t.value, t.column) for t in scanned
+        ]
+
+    def test_tokenize_many(self) -> None:
+        """Batch tokenizing matches tokenizing each source separately."""
+        sources = ["5 3 +", "", "2\n 3 *  ", "-1.5", "7\t8 /"]
+        assert Lexer.tokenize_many(sources) == [Lexer(s).tokenize() for s in sources]
+
+    def test_tokenize_many_error_in_later_source(self) -> None:
+        """Errors are positioned within the source that contains them."""
+        with pytest.raises(LexerError) as exc_info:
+            Lexer.tokenize_many(["5 3 +\n1 2 *", "1\n2 @ +"])
+        assert (exc_info.value.line, exc_info.value.column) == (2, 3)
+
+    def test_tokenize_many_separator_in_source(self) -> None:
+        """A source containing the internal separator is still rejected."""
+        with pytest.raises(LexerError) as exc_info:
+            Lexer.tokenize_many(["5 3 +", "4\t2\x00 -"])
+        assert (exc_info.value.line, exc_info.value.column) == (1, 4)
+        assert exc_info.value.message == "Unexpected character '\x00'"
+
+    def test_non_ascii_digit(self) -> None:
+        """Lexer accepts only ASCII digits in numbers."""
+        with pytest.raises(LexerError) as exc_info:
+            Lexer("5 \u0663").tokenize()
+        assert exc_info.value.column == 3
+
 
 class TestParser:
     """Test the parser module."""
@@ -120,13 +167,13 @@ class TestParser:
         assert isinstance(ast.right, Number)
         assert ast.right.value == "4"
 
-    def test_all_operators(self) -> None:
+    @pytest.mark.parametrize("op_char", ["+", "-", "*", "/"])
+    def test_all_operators(self, op_char: str) -> None:
         """Parser handles all four operators."""
-        for op_char, op_token in [("+", "+"), ("-", "-"), ("*", "*"), ("/", "/")]:
-            tokens = Lexer(f"5 3 {op_char}").tokenize()
-            ast = Parser(tokens).parse()
-            assert isinstance(ast, BinaryOp)
-            assert ast.operator == op_token
+        tokens = Lexer(f"5 3 {op_char}").tokenize()
+        ast = Parser(tokens).parse()
+        assert isinstance(ast, BinaryOp)
+        assert ast.operator == op_char
 
     def test_empty_input(self) -> None:
         """Parser raises error for empty input."""
@@ -235,6 +282,79 @@ class TestLaTeXGenerator:
         latex = LaTeXGenerator().generate(outer)
         assert latex == r"$5 \times 3 + 2$"
 
+    def test_deeply_nested(self) -> None:
+        """Generator handles trees deeper than the recursion limit."""
+        ast: Expr = Number(1, 1, "1")
+        for _ in range(5000):
+            ast = BinaryOp(1, 1, "+", ast, Number(1, 1, "2"))
+        latex = LaTeXGenerator().generate(ast)
+        assert latex == "$1" + " + 2" * 5000 + "$"
+
+    @pytest.mark.skipif(
+        AST_NODES_COMPILED,
+        reason="compiled BinaryOp rejects non-Expr children before the walk",
+    )
+    def test_unknown_node_type(self) -> None:
+        """Generator rejects node types it has no rendering for."""
+        unknown = cast("Expr", ASTNode(1, 3))
+        ast = BinaryOp(1, 1, "+", Number(1, 1, "5"), unknown)
+        with pytest.raises(NotImplementedError, match="ASTNode"):
+            LaTeXGenerator().generate(ast)
+
+    def test_memo_off_by_default(self) -> None:
+        """Without memo_size the generator keeps no rendered trees."""
+        generator = LaTeXGenerator()
+        for _ in range(3):
+            generator.generate(Parser(Lexer("5 3 + 2 *").tokenize()).parse())
+        assert generator._memo == {}
+
+    def test_memoized_by_node(self) -> None:
+        """Generating the same tree twice reuses the rendered LaTeX."""
+        ast = Parser(Lexer("5 3 + 2 *").tokenize()).parse()
+        generator = LaTeXGenerator(memo_size=4)
+        first = generator.generate(ast)
+        assert generator._memo[id(ast)] == (ast, first[1:-1])
+        # A hit must come from the memo, not a fresh walk
+        generator._memo[id(ast)] = (ast, "cached")
+        assert generator.generate(ast) == "$cached$"
+
+    def test_memo_evicts_least_recent(self) -> None:
+        """The memo holds at most memo_size trees, dropping the oldest."""
+        generator = LaTeXGenerator(memo_size=2)
+        first, second, third = (
+            Parser(Lexer(rpn).tokenize()).parse() for rpn in ("1 2 +", "3 4 +", "5 6 +")
+        )
+        generator.generate(first)
+        generator.generate(second)
+        generator.generate(first)
+        generator.generate(third)
+        assert list(generator._memo) == [id(first), id(third)]
+
+    def test_memoized_subtree_reused(self) -> None:
+        """A tree built on an already rendered tree reuses its LaTeX."""
+        generator = LaTeXGenerator(memo_size=4)
+        inner = Parser(Lexer("5 3 -").tokenize()).parse()
+        assert generator.generate(inner) == "$5 - 3$"
+        generator._memo[id(inner)] = (inner, "cached")
+        outer = BinaryOp(1, 1, "-", Number(1, 1, "9"), inner)
+        assert generator.generate(outer) == "$9 - ( cached )$"
+        # Templates need real operand slots, so they never use the memo
+        assert generator.compile(outer)("1", "2", "3") == "$1 - ( 2 - 3 )$"
+
+    def test_compile_template(self) -> None:
+        """A compiled template renders same-shaped trees from new values."""
+        ast = Parser(Lexer("5 3 - 2 -").tokenize()).parse()
+        render = LaTeXGenerator().compile(ast)
+        assert render("5", "3", "2") == LaTeXGenerator().generate(ast)
+        assert render("1", "-4", "7.5") == "$1 - -4 - 7.5$"
+
+    @pytest.mark.parametrize("values", [("1", "2"), ("1", "2", "3", "4")])
+    def test_compile_template_operand_count(self, values: tuple[str, ...]) -> None:
+        """A compiled template rejects too few or too many operands."""
+        render = LaTeXGenerator().compile(Parser(Lexer("5 3 - 2 -").tokenize()).parse())
+        with pytest.raises(TypeError, match=f"takes 3 operands, got {len(values)}"):
+            render(*values)
+
 
 class TestErrorFormatter:
     """Test the error formatter module."""
@@ -259,6 +379,60 @@ class TestErrorFormatter:
         assert caret_idx == 4  # 0-indexed column 4 = 1-indexed column 5
 
 
+class TestParseSource:
+    """Test the cached parse API."""
+
+    def test_cached_ast_is_shared(self) -> None:
+        """Equal sources return the same AST object."""
+        ast = parse_source("2 3 + 4 *")
+        assert parse_source("2 3 + 4 *") is ast
+        assert LaTeXGenerator().generate(ast) == "$( 2 + 3 ) \\times 4$"
+
+    def test_errors_not_cached(self) -> None:
+        """Invalid input raises on every call."""
+        for _ in range(2):
+            with pytest.raises(ParserError):
+                parse_source("5 +")
+
+
+class TestFastConvert:
+    """Test the fused single-pass converter."""
+
+    @pytest.mark.parametrize(
+        "rpn", ["42", "5 3 + 2 *", "5 3 2 - -", "10 2 / 5 /", "1 2 + 3 4 + *"]
+    )
+    def test_matches_pipeline(self, rpn: str) -> None:
+        """Fast path produces exactly the pipeline's output."""
+        ast = Parser(Lexer(rpn).tokenize()).parse()
+        assert convert(rpn) == LaTeXGenerator().generate(ast)
+
+    @pytest.mark.parametrize(
+        "rpn",
+        [
+            "1 " + "2 - " * 5000,
+            "1 " * 5001 + "- " * 5000,
+            "1 " + "2 + 3 * " * 2500,
+        ],
+        ids=["left-deep", "right-deep", "alternating"],
+    )
+    def test_deep_input_matches_pipeline(self, rpn: str) -> None:
+        """Fast path matches the pipeline on trees deeper than the recursion limit."""
+        ast = Parser(Lexer(rpn).tokenize()).parse()
+        assert convert(rpn) == LaTeXGenerator().generate(ast)
+
+    def test_lexer_error(self) -> None:
+        """Invalid characters raise the pipeline's LexerError."""
+        with pytest.raises(LexerError) as exc_info:
+            convert("5 @ 3")
+        assert exc_info.value.column == 3
+
+    def test_parser_error(self) -> None:
+        """Invalid RPN raises the pipeline's ParserError."""
+        with pytest.raises(ParserError) as exc_info:
+            convert("5 3")
+        assert "2 values remain" in str(exc_info.value)
+
+
 class TestIntegration:
     """Integration tests for the full pipeline."""
 
@@ -290,3 +464,53 @@ class TestIntegration:
         # Should have division and multiplication symbols
         assert r"\div" in latex
         assert r"\times" in latex
+
+
+class TestCLI:
+    """Test the command-line interface."""
+
+    def test_batch(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Batch mode converts one expression per line, skipping blanks."""
+        source = tmp_path / "input.rpn"
+        source.write_text("5 3 +\n\n2 3 4 * +\n")
+        monkeypatch.setattr("sys.argv", ["rpn2tex", "--batch", str(source)])
+        assert main() == 0
+        assert capsys.readouterr().out == "$5 + 3$\n$2 + 3 \\times 4$\n"
+
+    def test_batch_error_line(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Batch mode reports errors at their line in the input."""
+        source = tmp_path / "input.rpn"
+        source.write_text("5 3 +\n2 @\n")
+        monkeypatch.setattr("sys.argv", ["rpn2tex", "--batch", str(source)])
+        assert main() == 1
+        assert "2 | 2 @" in capsys.readouterr().err
+
+    def test_batch_blank_input(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Batch mode writes nothing for blank-only input, to either target."""
+        source = tmp_path / "input.rpn"
+        source.write_text("\n  \n\n")
+        monkeypatch.setattr("sys.argv", ["rpn2tex", "--batch", str(source)])
+        assert main() == 0
+        assert capsys.readouterr().out == ""
+
+        output = tmp_path / "output.tex"
+        monkeypatch.setattr(
+            "sys.argv", ["rpn2tex", "--batch", str(source), "-o", str(output)]
+        )
+        assert main() == 0
+        assert output.read_text() == ""